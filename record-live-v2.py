@@ -13,8 +13,9 @@ import time
 import threading
 import subprocess
 import queue
+import shutil
 import tempfile
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import termios
@@ -22,21 +23,116 @@ import tty
 import select
 import signal
 
+import numpy as np
+from faster_whisper import WhisperModel
+
+SAMPLE_RATE = 16000
+QUEUE_DRAIN_LIMIT = 8
+
+# Transcript scaffolding, built once at import
+_TRANSCRIPT_TEMPLATE = """\
+# Audio Journal - {date}
+
+**Audio:** `{audio_name}` | **Duration:** {duration} | **Segments:** {segment_count}
+
+---
+
+## Transcript
+
+{transcript}
+
+---
+
+## Metadata
+
+- **Words:** {word_count}
+- **Duration:** {duration}
+- **Paragraphs:** {paragraph_count}
+- **Model:** whisper-{model}
+- **Live Transcription:** Yes (with overlap)
+
+---
+
+## Notes
+
+<!-- Add your thoughts, tags, or follow-up notes here -->
+
+"""
+
+# ANSI codes, precomputed once
+RED = "\033[31m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+MAGENTA = "\033[35m"
+CYAN = "\033[36m"
+GRAY = "\033[90m"
+RESET = "\033[0m"
+
 class LiveRecorder:
     def __init__(self):
         self.journal_dir = Path(os.environ.get('JOURNAL_DIR', Path.home() / 'Documents' / 'AudioJournal'))
         self.whisper_model = os.environ.get('WHISPER_MODEL', 'base')
+        # Load the model once, in-process. The old per-segment `whisper` CLI
+        # reloaded weights from disk on every call; this dominated latency.
+        # compute_type='auto' lets CTranslate2 pick the fastest type the
+        # hardware supports (INT8 on VNNI CPUs, BF16/FP16 where available)
+        # instead of hand-rolled CUDA detection. Overridable via env vars.
+        device = os.environ.get('WHISPER_DEVICE', 'auto')
+        compute_type = os.environ.get('WHISPER_COMPUTE_TYPE', 'auto')
+
+        self.backend = os.environ.get('WHISPER_BACKEND', 'faster-whisper')
+        if self.backend == 'trt':
+            # Optional TensorRT engine for NVIDIA users (pip install whisper-trt)
+            from whisper_trt import load_trt_model
+            self.model = load_trt_model(self.whisper_model)
+        else:
+            self.backend = 'faster-whisper'
+            self.model = WhisperModel(
+                self.whisper_model,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=max(2, (os.cpu_count() or 2) - 1)  # Leave a core for capture/UI
+            )
+        # One model serves both passes; preview just gets a smaller decode
+        # budget. Serialize access so preview and final don't contend.
+        self.model_lock = threading.Lock()
         self.recording = False
+        self.stop_event = threading.Event()
+        # Self-pipe to wake the blocking input select() on shutdown
+        self.wake_r, self.wake_w = os.pipe()
+        # Key -> action table; \r and \n both mean paragraph so pasted
+        # newlines and the Return key behave identically
+        self._keymap = {
+            b'\r': 'paragraph',
+            b'\n': 'paragraph',
+            b'.': 'sentence',
+            b'\x03': 'stop',
+        }
         self.segments = []
         self.transcription_queue = queue.Queue()
         self.results = {}
         self.temp_dir = Path(tempfile.mkdtemp())
-        self.main_audio_file = self.temp_dir / "recording.wav"
-        self.last_segment_end = 0.0  # Track where last segment actually ended
+        self.last_segment_end = 0  # Sample index where last segment ended
         self.start_time = None
         self.current_draft = {}  # Store draft transcriptions
         self.overlap_seconds = 1.0  # Overlap between segments
-        
+
+        # Rolling PCM buffer fed directly from sox stdout, backed by a
+        # memory-mapped raw file. Segments are sliced in-memory and handed
+        # straight to the model, and the final encode reads the same file -
+        # the samples are never copied through Python twice.
+        max_seconds = int(os.environ.get('MAX_RECORD_SECONDS', 7200))
+        self.pcm_path = self.temp_dir / 'rec.s16le'
+        self.audio_buffer = np.memmap(
+            self.pcm_path, dtype=np.int16, mode='w+',
+            shape=(max_seconds * SAMPLE_RATE,)
+        )
+        self.samples_written = 0
+
+        # Final encode runs here, overlapped with the last transcriptions
+        self.encoder_pool = ThreadPoolExecutor(max_workers=1)
+        self.encode_future = None
+
         # Setup directories
         self.year = datetime.now().strftime("%Y")
         self.audio_dir = self.journal_dir / 'audio' / self.year
@@ -52,50 +148,72 @@ class LiveRecorder:
         """Start sox recording in background"""
         self.recording = True
         self.start_time = time.time()
-        
-        # Start sox with larger buffer for better real-time performance
+
+        # Stream raw 16-bit PCM to stdout; a reader thread fills the buffer
         self.sox_process = subprocess.Popen([
-            'sox', '-t', 'coreaudio', '-d', 
-            '-r', '16000',  # Lower sample rate for faster processing
-            str(self.main_audio_file),
-            'silence', '1', '0.1', '1%', '1', '120.0', '1%'
-        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        
-        print(f"\033[32m🎙️  Recording started - {self.filename}\033[0m")
-        print("\033[33mPress RETURN for new paragraph, '.' for sentence end, Ctrl+C to finish\033[0m")
-        print("\033[36m" + "="*60 + "\033[0m\n")
-        print("\033[90m[Draft text will appear here as you speak...]\033[0m\n")
+            'sox', '-t', 'coreaudio', '-d',
+            '-r', str(SAMPLE_RATE),  # Lower sample rate for faster processing
+            '-c', '1', '-b', '16', '-e', 'signed-integer',
+            '-t', 'raw', '-'
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+        self.reader_thread = threading.Thread(target=self.read_audio, daemon=True)
+        self.reader_thread.start()
+
+        sys.stdout.write(
+            f"{GREEN}🎙️  Recording started - {self.filename}{RESET}\n"
+            f"{YELLOW}Press RETURN for new paragraph, '.' for sentence end, Ctrl+C to finish{RESET}\n"
+            f"{CYAN}{'=' * 60}{RESET}\n\n"
+            f"{GRAY}[Draft text will appear here as you speak...]{RESET}\n\n"
+        )
+        sys.stdout.flush()
         
+    def read_audio(self):
+        """Reader thread: fill the PCM buffer from sox stdout"""
+        pipe = self.sox_process.stdout
+        chunk_samples = 4096
+        while True:
+            data = pipe.read(chunk_samples * 2)  # 16-bit samples
+            if not data:
+                break
+            samples = np.frombuffer(data, dtype=np.int16)
+            end = min(self.samples_written + len(samples), len(self.audio_buffer))
+            self.audio_buffer[self.samples_written:end] = samples[:end - self.samples_written]
+            self.samples_written = end
+
     def mark_segment(self, segment_type='paragraph'):
         """Mark current position as segment boundary with overlap"""
         if not self.recording:
             return
-            
-        current_time = time.time() - self.start_time
-        
+
+        current_idx = self.samples_written
+        overlap_samples = int(self.overlap_seconds * SAMPLE_RATE)
+
         # Ensure minimum segment length
-        if current_time > self.last_segment_end + 0.5:
+        if current_idx > self.last_segment_end + SAMPLE_RATE // 2:
             # Start segment slightly before last end for continuity
-            segment_start = max(0, self.last_segment_end - self.overlap_seconds)
-            
+            segment_start = max(0, self.last_segment_end - overlap_samples)
+
             segment = {
                 'start': segment_start,
-                'end': current_time,
+                'end': current_idx,
                 'type': segment_type,
                 'index': len(self.segments),
                 'actual_start': self.last_segment_end  # Where new content actually begins
             }
             self.segments.append(segment)
-            self.last_segment_end = current_time
-            
+            self.last_segment_end = current_idx
+
             # Queue for transcription
             self.transcription_queue.put(segment)
-            
+
             # Visual feedback
+            current_time = current_idx / SAMPLE_RATE
             if segment_type == 'paragraph':
-                print(f"\n\033[35m[¶ New paragraph at {self.format_time(current_time)}]\033[0m")
+                sys.stdout.write(f"\n{MAGENTA}[¶ New paragraph at {self.format_time(current_time)}]{RESET}\n")
             else:
-                print(f"\033[35m[. Sentence at {self.format_time(current_time)}]\033[0m", end='')
+                sys.stdout.write(f"{MAGENTA}[. Sentence at {self.format_time(current_time)}]{RESET}")
+            sys.stdout.flush()
             
             # Start live preview for this segment
             threading.Thread(target=self.show_live_preview, args=(segment,), daemon=True).start()
@@ -109,199 +227,282 @@ class LiveRecorder:
         return f"{mins:02d}:{secs:02d}"
         
     def extract_segment_audio(self, segment):
-        """Extract audio segment with proper timing"""
-        output_file = self.temp_dir / f"segment_{segment['index']}.wav"
-        
-        # Wait for audio to be written to disk
-        time.sleep(1.0)
-        
-        # Extract with slight padding
-        cmd = [
-            'ffmpeg', '-i', str(self.main_audio_file),
-            '-ss', str(segment['start']),
-            '-to', str(segment['end'] + 0.5),  # Add small buffer at end
-            '-c', 'copy',
-            str(output_file),
-            '-y', '-loglevel', 'error'
-        ]
-        
-        subprocess.run(cmd, check=False)
-        return output_file if output_file.exists() else None
-        
+        """Slice segment audio from the in-memory buffer (zero-copy view)"""
+        # The buffer is authoritative - no need to wait for disk writes.
+        # Add small padding at end for words caught mid-utterance.
+        end_idx = min(segment['end'] + SAMPLE_RATE // 2, self.samples_written)
+        audio = self.audio_buffer[segment['start']:end_idx]
+        if not audio.size:
+            return None
+        # Model wants float32; convert only the slice being transcribed
+        return audio.astype(np.float32) / 32768.0
+
+    def run_model(self, audio, preview=False, backlog=False):
+        """Run the loaded backend on an audio slice, return plain text"""
+        with self.model_lock:
+            if self.backend == 'trt':
+                # whisper_trt returns the full text directly
+                return self.model.transcribe(audio)['text'].strip()
+            if backlog:
+                # Queue is backed up: greedy decode to clear it faster,
+                # through the sequential path so segments of any length
+                # decode the same audio the normal path would
+                segments, info = self.model.transcribe(
+                    audio,
+                    beam_size=1,
+                    best_of=1,
+                    vad_filter=False,
+                    condition_on_previous_text=False
+                )
+            elif preview:
+                segments, info = self.model.transcribe(
+                    audio,
+                    beam_size=1,
+                    best_of=1,
+                    temperature=0.0,
+                    without_timestamps=True,
+                    vad_filter=False,
+                    condition_on_previous_text=False
+                )
+            else:
+                segments, info = self.model.transcribe(
+                    audio,
+                    beam_size=5,
+                    temperature=(0.0, 0.2, 0.4),
+                    vad_filter=False,
+                    condition_on_previous_text=False
+                )
+            return " ".join(s.text for s in segments).strip()
+
     def show_live_preview(self, segment):
         """Show preliminary transcription quickly"""
         # Quick and dirty transcription for preview
-        audio_file = self.extract_segment_audio(segment)
-        if not audio_file:
+        audio = self.extract_segment_audio(segment)
+        if audio is None:
             return
-            
+
         try:
-            # Use tiny model for fast preview if available
-            preview_model = 'tiny' if segment['index'] > 0 else self.whisper_model
-            
-            print(f"\033[90m[Transcribing segment {segment['index']+1}...]\033[0m", end='\r')
-            
-            result = subprocess.run([
-                'whisper', str(audio_file),
-                '--model', preview_model,
-                '--output_format', 'txt',
-                '--output_dir', str(self.temp_dir),
-                '--verbose', 'False',
-                '--fp16', 'False'
-            ], capture_output=True, text=True, timeout=30)
-            
-            txt_file = audio_file.with_suffix('.txt')
-            if txt_file.exists():
-                with open(txt_file) as f:
-                    draft_text = f.read().strip()
-                    
+            sys.stdout.write(f"{GRAY}[Transcribing segment {segment['index']+1}...]{RESET}\r")
+            sys.stdout.flush()
+
+            # Greedy decode for a fast draft
+            draft_text = self.run_model(audio, preview=True)
+
+            if draft_text:
                 # Store draft
                 self.current_draft[segment['index']] = draft_text
-                
-                # Clear the "Transcribing..." message
-                print(' ' * 40, end='\r')
-                
-                # Show draft in gray/italic
-                print(f"\033[90m[{self.format_time(segment['actual_start'])}] {draft_text}\033[0m")
-                
+
+                # Clear the "Transcribing..." message, then show the
+                # draft in gray - one write, one flush
+                start_time = segment['actual_start'] / SAMPLE_RATE
+                sys.stdout.write(
+                    f"{' ' * 40}\r"
+                    f"{GRAY}[{self.format_time(start_time)}] {draft_text}{RESET}\n"
+                )
+                sys.stdout.flush()
+
         except Exception as e:
             pass  # Silently fail for preview
             
-    def transcribe_segment(self, segment):
+    def remove_overlap(self, prev_text, new_text):
+        """Strip the longest prev-suffix / new-prefix word overlap from new_text
+
+        The 1s segment overlap means the start of each transcription usually
+        repeats the tail of the previous one. A KMP failure-function pass over
+        the word sequences finds the longest such overlap in O(n), instead of
+        the old fixed 5-word substring check that missed most of them.
+        """
+        def norm(word):
+            return word.strip('.,!?;:').lower()
+
+        new_words = new_text.split()
+        # Only the boundary region can overlap; cap the window
+        pattern = [norm(w) for w in new_words[:40]]
+        prev_tail = [norm(w) for w in prev_text.split()[-40:]]
+        if not pattern or not prev_tail:
+            return new_text
+
+        # Failure array over pattern + sentinel + prev tail; the final value
+        # is the longest prefix of new_text that is also a suffix of prev_text
+        s = pattern + ['\x00'] + prev_tail
+        fail = [0] * len(s)
+        k = 0
+        for i in range(1, len(s)):
+            while k and s[i] != s[k]:
+                k = fail[k - 1]
+            if s[i] == s[k]:
+                k += 1
+            fail[i] = k
+
+        # A single shared word is as likely coincidence as overlap (the
+        # overlap window is often silence when the user pauses before
+        # marking); only strip when at least two words match
+        overlap = fail[-1]
+        if overlap >= 2:
+            return ' '.join(new_words[overlap:])
+        return new_text
+
+    def transcribe_segment(self, segment, backlog=False):
         """Full quality transcription for final version"""
-        audio_file = self.temp_dir / f"segment_{segment['index']}.wav"
-        
-        # Re-extract if needed for better quality
-        if not audio_file.exists():
-            audio_file = self.extract_segment_audio(segment)
-            
-        if not audio_file:
+        audio = self.extract_segment_audio(segment)
+        if audio is None:
             return None
-            
+
         try:
-            # Full quality transcription
-            result = subprocess.run([
-                'whisper', str(audio_file),
-                '--model', self.whisper_model,
-                '--output_format', 'json',
-                '--output_dir', str(self.temp_dir),
-                '--verbose', 'False',
-                '--fp16', 'False'
-            ], capture_output=True, text=True)
-            
-            # Parse result
-            json_file = audio_file.with_suffix('.json')
-            if json_file.exists():
-                with open(json_file) as f:
-                    data = json.load(f)
-                    full_text = data.get('text', '').strip()
-                    
-                    # If we have overlap, try to remove duplicate content
-                    if segment['index'] > 0 and segment['index']-1 in self.results:
-                        prev_text = self.results[segment['index']-1]['text']
-                        # Simple deduplication - look for overlap
-                        if len(prev_text) > 20:
-                            # Check if beginning of new text appears at end of previous
-                            words_to_check = full_text.split()[:5]
-                            if words_to_check:
-                                check_phrase = ' '.join(words_to_check)
-                                if check_phrase in prev_text:
-                                    # Remove the overlapping part
-                                    idx = full_text.find(check_phrase)
-                                    if idx > 0:
-                                        full_text = full_text[idx+len(check_phrase):].strip()
-                    
-                    return full_text
-                    
+            # Full quality transcription - wider beam, same weights
+            full_text = self.run_model(audio, backlog=backlog)
+
+            # If we have overlap, remove duplicate content
+            if segment['index'] > 0 and segment['index']-1 in self.results:
+                prev_text = self.results[segment['index']-1]['text']
+                full_text = self.remove_overlap(prev_text, full_text)
+
+            return full_text
+
         except Exception as e:
-            print(f"\033[31mTranscription error: {e}\033[0m")
+            print(f"{RED}Transcription error: {e}{RESET}")
             
         return None
         
     def transcription_worker(self):
         """Background thread for processing final transcriptions"""
-        while self.recording or not self.transcription_queue.empty():
+        # Deprioritize this thread so the model can't starve sox capture or
+        # the input/display thread during long segments. nice() is
+        # per-thread on Linux; on macOS it just lowers the whole process a
+        # notch, which is still the right trade for a background recorder.
+        try:
+            os.nice(10)
+        except OSError:
+            pass
+        # On Linux, additionally keep one core free for capture and UI
+        if hasattr(os, 'sched_setaffinity'):
             try:
-                segment = self.transcription_queue.get(timeout=1)
-                
-                # Wait a bit for better audio capture
-                time.sleep(0.5)
-                
-                text = self.transcribe_segment(segment)
-                if text:
-                    self.results[segment['index']] = {
-                        'text': text,
-                        'start': segment['actual_start'],
-                        'end': segment['end'],
-                        'type': segment['type']
-                    }
-                    
-                    # Display final result (overwrite draft)
-                    print(f"\033[32m[{self.format_time(segment['actual_start'])}] {text}\033[0m\n")
-                    
+                cores = sorted(os.sched_getaffinity(0))
+                if len(cores) > 1:
+                    os.sched_setaffinity(0, set(cores[1:]))
+            except OSError:
+                pass
+
+        while not self.stop_event.is_set() or not self.transcription_queue.empty():
+            try:
+                batch = [self.transcription_queue.get(timeout=1)]
             except queue.Empty:
                 continue
-            except Exception as e:
-                print(f"\033[31mWorker error: {e}\033[0m")
-                
-    def get_single_char(self):
-        """Get single character input without blocking"""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                ch = sys.stdin.read(1)
-                return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return None
-        
+
+            # Drain whatever else is queued (fast sentence marking can
+            # outpace transcription) and clear the backlog with a cheaper
+            # decode
+            while len(batch) < QUEUE_DRAIN_LIMIT:
+                try:
+                    batch.append(self.transcription_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for segment in batch:
+                try:
+                    text = self.transcribe_segment(segment, backlog=len(batch) > 1)
+                    if text:
+                        start_time = segment['actual_start'] / SAMPLE_RATE
+                        self.results[segment['index']] = {
+                            'text': text,
+                            'start': start_time,
+                            'end': segment['end'] / SAMPLE_RATE,
+                            'type': segment['type']
+                        }
+
+                        # Display final result (overwrite draft)
+                        sys.stdout.write(f"{GREEN}[{self.format_time(start_time)}] {text}{RESET}\n\n")
+                        sys.stdout.flush()
+
+                except Exception as e:
+                    print(f"{RED}Worker error: {e}{RESET}")
+                finally:
+                    self.transcription_queue.task_done()
+
     def monitor_input(self):
-        """Monitor keyboard input during recording"""
+        """Monitor keyboard input during recording
+
+        The terminal is already in cbreak mode (set once in run()), so this
+        just blocks on select() until a key arrives or the wake pipe fires -
+        no per-keystroke termios calls, no 10 Hz polling.
+        """
+        stdin_fd = sys.stdin.fileno()
         while self.recording:
-            ch = self.get_single_char()
-            if ch:
-                if ch == '\r' or ch == '\n':  # Return key
-                    self.mark_segment('paragraph')
-                elif ch == '.':  # Period key
-                    self.mark_segment('sentence')
-                elif ch == '\x03':  # Ctrl+C
+            try:
+                readable, _, _ = select.select([stdin_fd, self.wake_r], [], [])
+                if self.wake_r in readable:
+                    os.read(self.wake_r, 1)
+                    break
+                ch = os.read(stdin_fd, 1)
+                action = self._keymap.get(ch)
+                if action is None:
+                    continue
+                if action == 'stop':
                     self.stop_recording()
                     break
-                    
+                self.mark_segment(action)
+            except KeyboardInterrupt:
+                # cbreak keeps ISIG, so Ctrl+C arrives as SIGINT here
+                self.stop_recording()
+                break
+
+
     def stop_recording(self):
         """Stop recording and finalize"""
         if not self.recording:
             return
             
-        print("\n\n\033[33m⏹️  Stopping recording...\033[0m")
+        print(f"\n\n{YELLOW}⏹️  Stopping recording...{RESET}")
         
         # Mark final segment
         self.mark_segment('paragraph')
         
         self.recording = False
+        self.stop_event.set()
+        os.write(self.wake_w, b'x')  # Break monitor_input out of select()
         if hasattr(self, 'sox_process'):
             self.sox_process.terminate()
             self.sox_process.wait()
-            
-        # Wait for transcriptions to complete
-        print("\033[33m⏳ Finishing final transcriptions...\033[0m")
-        while not self.transcription_queue.empty():
-            time.sleep(0.5)
-        time.sleep(3)  # Give time for final processing
+            self.reader_thread.join()  # Drain the last buffered samples
+
+        # Start the final encode now so it runs while the remaining
+        # segments transcribe; save_results collects the future. Skip it
+        # when nothing was marked (immediate Ctrl+C) - no transcript will
+        # be saved, so don't leave an orphan audio file either.
+        if self.segments:
+            self.encode_future = self.encoder_pool.submit(self.encode_audio)
+
+        # Block until every queued segment has been task_done()'d -
+        # no sleep polling, no flat grace period
+        print(f"{YELLOW}⏳ Finishing final transcriptions...{RESET}")
+        self.transcription_queue.join()
         
+    def encode_audio(self):
+        """Encode the recording to Opus straight from the memmapped PCM
+
+        No intermediate WAV and no copy through Python; ffmpeg reads the raw
+        file. Opus at 24k/voip beats 64k AAC for speech and encodes faster
+        (no resample - the stream is already 16 kHz mono). Submitted to the
+        encoder pool from stop_recording so it overlaps the remaining
+        transcriptions.
+        """
+        final_audio = self.audio_dir / f"{self.filename}.opus"
+        self.audio_buffer.flush()
+        os.truncate(self.pcm_path, self.samples_written * 2)  # Drop unused tail
+        with open(self.pcm_path, 'rb') as pcm:
+            subprocess.run([
+                'ffmpeg', '-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', '1', '-i', '-',
+                '-c:a', 'libopus', '-b:a', '24k', '-vbr', 'on', '-application', 'voip',
+                str(final_audio), '-y', '-loglevel', 'error'
+            ], stdin=pcm)
+        return final_audio
+
     def save_results(self):
         """Save audio and create transcript file"""
-        # Compress audio
-        final_audio = self.audio_dir / f"{self.filename}.m4a"
-        print(f"\033[33m🔄 Compressing audio...\033[0m")
-        subprocess.run([
-            'ffmpeg', '-i', str(self.main_audio_file),
-            '-c:a', 'aac', '-b:a', '64k', '-ar', '22050',
-            str(final_audio), '-y', '-loglevel', 'error'
-        ])
-        
+        # Encode started back in stop_recording; collect it here
+        print(f"{YELLOW}🔄 Compressing audio...{RESET}")
+        final_audio = self.encode_future.result()
+
         # Build transcript
         transcript_parts = []
         for i in sorted(self.results.keys()):
@@ -313,76 +514,89 @@ class LiveRecorder:
                 
         full_transcript = "\n".join(transcript_parts)
         
-        # Create markdown file
+        # Create markdown file in a single write
         transcript_file = self.transcript_dir / f"{self.filename}.md"
         duration = self.format_time(time.time() - self.start_time)
         word_count = sum(len(r['text'].split()) for r in self.results.values())
+        paragraph_count = sum(1 for r in self.results.values() if r['type'] == 'paragraph')
+
+        transcript_file.write_text(_TRANSCRIPT_TEMPLATE.format(
+            date=datetime.now().strftime('%B %d, %Y at %I:%M %p'),
+            audio_name=final_audio.name,
+            duration=duration,
+            segment_count=len(self.results),
+            transcript=full_transcript,
+            word_count=word_count,
+            paragraph_count=paragraph_count,
+            model=self.whisper_model,
+        ), encoding='utf-8')
+
+        sys.stdout.write(
+            f"\n{GREEN}✅ Journal entry saved!{RESET}\n"
+            f"  🎵 Audio: {final_audio.name}\n"
+            f"  📄 Transcript: {transcript_file.name}\n"
+        )
+        sys.stdout.flush()
         
-        with open(transcript_file, 'w') as f:
-            f.write(f"# Audio Journal - {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n\n")
-            f.write(f"**Audio:** `{self.filename}.m4a` | **Duration:** {duration} | ")
-            f.write(f"**Segments:** {len(self.results)}\n\n")
-            f.write("---\n\n")
-            f.write("## Transcript\n\n")
-            f.write(full_transcript)
-            f.write("\n\n---\n\n")
-            f.write("## Metadata\n\n")
-            f.write(f"- **Words:** {word_count}\n")
-            f.write(f"- **Duration:** {duration}\n")
-            f.write(f"- **Paragraphs:** {sum(1 for r in self.results.values() if r['type'] == 'paragraph')}\n")
-            f.write(f"- **Model:** whisper-{self.whisper_model}\n")
-            f.write(f"- **Live Transcription:** Yes (with overlap)\n")
-            f.write("\n---\n\n")
-            f.write("## Notes\n\n")
-            f.write("<!-- Add your thoughts, tags, or follow-up notes here -->\n\n")
-            
-        print(f"\n\033[32m✅ Journal entry saved!\033[0m")
-        print(f"  🎵 Audio: {final_audio.name}")
-        print(f"  📄 Transcript: {transcript_file.name}")
-        
-        # Git commit
+        # Git commit. Two calls are the floor here: `git commit -o` can't
+        # take an untracked path, and pygit2 isn't worth a binary dep for
+        # a once-per-entry operation.
         if (self.journal_dir / '.git').exists():
-            subprocess.run(['git', 'add', str(transcript_file)], 
-                         cwd=self.journal_dir, capture_output=True)
+            git_env = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+            subprocess.run(['git', 'add', '--', str(transcript_file)],
+                         cwd=self.journal_dir, env=git_env,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             subprocess.run(['git', 'commit', '-q', '-m', f'Add live entry: {self.filename}'],
-                         cwd=self.journal_dir, capture_output=True)
+                         cwd=self.journal_dir, env=git_env,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
         # Cleanup
-        for file in self.temp_dir.glob('*'):
-            file.unlink()
-        self.temp_dir.rmdir()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
         
     def run(self):
         """Main execution"""
         try:
-            # Check dependencies
-            for cmd in ['sox', 'ffmpeg', 'whisper']:
-                if subprocess.run(['which', cmd], capture_output=True).returncode != 0:
-                    print(f"\033[31mError: {cmd} not found\033[0m")
-                    return
+            # Check dependencies (whisper runs in-process now)
+            missing = [cmd for cmd in ('sox', 'ffmpeg') if shutil.which(cmd) is None]
+            if missing:
+                print(f"{RED}Error: {', '.join(missing)} not found{RESET}")
+                return
                     
-            self.start_recording()
-            
-            # Start transcription worker
-            worker = threading.Thread(target=self.transcription_worker)
-            worker.start()
-            
-            # Monitor input
-            self.monitor_input()
-            
-            # Wait for worker
-            worker.join()
-            
+            # Enter cbreak mode once for the whole session (unbuffered keys,
+            # but output processing and SIGINT stay intact); restore on exit
+            stdin_fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(stdin_fd)
+            try:
+                tty.setcbreak(stdin_fd)
+
+                self.start_recording()
+
+                # Start transcription worker
+                worker = threading.Thread(target=self.transcription_worker)
+                worker.start()
+
+                # Monitor input
+                self.monitor_input()
+
+                # Wait for worker
+                worker.join()
+            finally:
+                termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_settings)
+
             # Save results
             if self.results:
                 self.save_results()
             else:
-                print("\033[33mNo segments transcribed\033[0m")
+                print(f"{YELLOW}No segments transcribed{RESET}")
+                # The encode may have run even though every transcription
+                # failed; don't keep audio with no transcript alongside it
+                if self.encode_future is not None:
+                    self.encode_future.result().unlink(missing_ok=True)
                 
         except KeyboardInterrupt:
             self.stop_recording()
         except Exception as e:
-            print(f"\033[31mError: {e}\033[0m")
+            print(f"{RED}Error: {e}{RESET}")
             self.stop_recording()
 
 if __name__ == "__main__":
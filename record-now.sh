@@ -37,7 +37,13 @@ check_dependency() {
 
 check_dependency "sox" "brew install sox"
 check_dependency "ffmpeg" "brew install ffmpeg"
-check_dependency "whisper" "pip install openai-whisper"
+
+# Transcription runs in-process via faster-whisper (no CLI needed)
+if ! python3 -c "import faster_whisper" &> /dev/null; then
+    echo -e "${RED}Error: faster-whisper not found${NC}"
+    echo "Install with: pip install faster-whisper"
+    exit 1
+fi
 
 # Clear screen and show interface
 clear
@@ -215,18 +215,23 @@ if [[ "$action" == "play" ]]; then
     audio_file="$JOURNAL_DIR/audio/$year/${basename_file}.m4a"
     
     # Check for other audio formats if m4a not found
+    if [[ ! -f "$audio_file" ]]; then
+        audio_file="$JOURNAL_DIR/audio/$year/${basename_file}.opus"
+    fi
     if [[ ! -f "$audio_file" ]]; then
         audio_file="$JOURNAL_DIR/audio/$year/${basename_file}.wav"
     fi
     
     if [[ -f "$audio_file" ]]; then
         echo -e "${GREEN}Playing: $(basename "$audio_file")${NC}"
-        if command -v afplay &> /dev/null; then
+        # afplay can't decode Opus, so route .opus through ffplay/mpv
+        # (ffmpeg is already a hard dependency)
+        if [[ "${audio_file##*.}" != "opus" ]] && command -v afplay &> /dev/null; then
             afplay "$audio_file"
-        elif command -v mpv &> /dev/null; then
-            mpv "$audio_file"
         elif command -v ffplay &> /dev/null; then
             ffplay -nodisp -autoexit "$audio_file" 2>/dev/null
+        elif command -v mpv &> /dev/null; then
+            mpv "$audio_file"
         else
             echo "Opening in default application..."
             open "$audio_file"